@@ -0,0 +1,34 @@
+-- One-off migration for databases created before the schema tuning series.
+--
+-- `init_db` uses `Base.metadata.create_all`, which only creates missing
+-- tables: it neither adds column defaults nor indexes to tables that already
+-- exist. Run this script once against such a database (e.g.
+-- `psql $DATABASE_URL -f scripts/migrate_existing_db.sql`); every statement
+-- is idempotent, so re-running it is safe. Fresh databases need none of this.
+
+-- createdAt moved from a client-side default to a server-side default so
+-- bulk inserts can omit the column entirely.
+ALTER TABLE persons ALTER COLUMN "createdAt" SET DEFAULT now();
+ALTER TABLE predictions ALTER COLUMN "createdAt" SET DEFAULT now();
+ALTER TABLE email_logs ALTER COLUMN "createdAt" SET DEFAULT now();
+ALTER TABLE prediction_processing_jobs ALTER COLUMN "createdAt" SET DEFAULT now();
+ALTER TABLE data_processing_jobs ALTER COLUMN "createdAt" SET DEFAULT now();
+
+-- Backfill rows inserted while the column had no default at all.
+UPDATE persons SET "createdAt" = now() WHERE "createdAt" IS NULL;
+UPDATE predictions SET "createdAt" = now() WHERE "createdAt" IS NULL;
+UPDATE email_logs SET "createdAt" = now() WHERE "createdAt" IS NULL;
+UPDATE prediction_processing_jobs SET "createdAt" = now() WHERE "createdAt" IS NULL;
+UPDATE data_processing_jobs SET "createdAt" = now() WHERE "createdAt" IS NULL;
+
+-- Status indexes for the polling/cleanup sweeps.
+CREATE INDEX IF NOT EXISTS ix_predictions_status ON predictions (status);
+CREATE INDEX IF NOT EXISTS ix_email_logs_status ON email_logs (status);
+CREATE INDEX IF NOT EXISTS ix_prediction_processing_jobs_status ON prediction_processing_jobs (status);
+CREATE INDEX IF NOT EXISTS ix_data_processing_jobs_status ON data_processing_jobs (status);
+CREATE INDEX IF NOT EXISTS ix_celery_tasks_log_status ON celery_tasks_log (status);
+
+-- Composite indexes.
+CREATE INDEX IF NOT EXISTS ix_email_logs_recipient_status ON email_logs (recipient, status);
+CREATE INDEX IF NOT EXISTS ix_celery_tasks_log_name_status ON celery_tasks_log ("taskName", status);
+CREATE INDEX IF NOT EXISTS ix_celery_taskmeta_status_date ON celery_taskmeta (status, date_done);
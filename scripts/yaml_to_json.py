@@ -0,0 +1,32 @@
+"""Convert `src/config/config.yaml` to a pre-resolved `config.json`.
+
+JSON parses much faster than YAML at import time, so this script converts the
+config once and writes the result next to the YAML file. Re-run it whenever
+`config.yaml` changes.
+
+Usage
+-----
+    python scripts/yaml_to_json.py
+"""
+
+import sys
+from pathlib import Path
+
+import orjson
+import yaml  # type: ignore[import-untyped]
+
+from src import PACKAGE_PATH
+
+config_path: Path = PACKAGE_PATH / "src/config/config.yaml"
+json_config_path: Path = PACKAGE_PATH / "src/config/config.json"
+
+
+def main() -> None:
+    """Parse the YAML config and write it out as JSON."""
+    config = yaml.safe_load(config_path.read_text())
+    json_config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    sys.stderr.write(f"Wrote {json_config_path}\n")
+
+
+if __name__ == "__main__":
+    main()
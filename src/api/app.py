@@ -1,9 +1,11 @@
+import os
 import sys
 import warnings
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.routes.v1 import health, prediction, status
 from src.api.utilities import lifespan
@@ -32,6 +34,11 @@ def create_application() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        # orjson serializes the bulk prediction/status payloads in C and
+        # emits bytes directly, skipping the str -> bytes encode
+        default_response_class=ORJSONResponse,
+        # No 307 redirect dance on trailing-slash mismatches
+        redirect_slashes=False,
     )
 
     app.add_middleware(
@@ -54,13 +61,18 @@ app = create_application()
 
 if __name__ == "__main__":
     try:
+        # uvloop + httptools swap in the Cython event loop and HTTP parser;
+        # workers fork one process per core slot (reload mode is single
+        # process, uvicorn ignores workers there anyway)
         uvicorn.run(
             "src.api.app:app",
             host=api_config.server.host,
             port=api_config.server.port,
             reload=api_config.server.reload,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WEB_CONCURRENCY", api_config.server.workers)),
         )
     except (Exception, KeyboardInterrupt) as e:
-        print(f"Error creating application: {e}")
-        print("Exiting gracefully...")
+        sys.stderr.write(f"Error creating application: {e}\nExiting gracefully...\n")
         sys.exit(1)
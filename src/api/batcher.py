@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from src import create_logger
+from src.celery_pkg.tasks import process_ml_data_chunk
+
+logger = create_logger(name="batcher")
+
+
+class MicroBatcher:
+    """Group single-prediction requests into one Celery dispatch.
+
+    Dispatching every /predict-single call on its own pays a full broker
+    round-trip per record. The batcher queues incoming records and sends one
+    `process_ml_data_chunk` task per batch: as soon as `max_batch_size`
+    records are waiting, or once the oldest record has waited
+    `batch_timeout_ms`. Callers await a future that resolves with the shared
+    task id and their index within the batch.
+    """
+
+    def __init__(self, max_batch_size: int, batch_timeout_ms: int) -> None:
+        """Initialize the batcher.
+
+        Parameters
+        ----------
+        max_batch_size : int
+            Maximum number of records dispatched in one Celery task.
+        batch_timeout_ms : int
+            Longest time a record waits for peers before dispatch, in ms.
+        """
+        self.max_batch_size = max_batch_size
+        self.batch_timeout: float = batch_timeout_ms / 1_000
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]] = (
+            asyncio.Queue()
+        )
+        self._runner: asyncio.Task[None] | None = None
+        self._chunk_id: int = 0
+
+    def start(self) -> None:
+        """Start the background dispatch loop on the running event loop."""
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the dispatch loop and fail any waiters still queued."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped before dispatch"))
+
+    async def submit(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Queue a record and wait for its batch to be dispatched.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            A single person record ready for prediction.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dispatch info: the shared task_id, this record's index within
+            the batch, and the batch size.
+        """
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect records into batches and dispatch them to Celery."""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block until the first record arrives, then keep filling the
+            # batch until it is full or the timeout window closes
+            batch: list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]] = [
+                await self._queue.get()
+            ]
+            deadline: float = loop.time() + self.batch_timeout
+            while len(batch) < self.max_batch_size:
+                remaining: float = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            records: list[dict[str, Any]] = [record for record, _ in batch]
+            self._chunk_id += 1
+            try:
+                task = process_ml_data_chunk.delay(records, self._chunk_id)
+            except Exception as e:
+                logger.error("Failed to dispatch batch of %s records: %s", len(records), e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for index, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result({
+                        "task_id": task.id,
+                        "index": index,
+                        "batch_size": len(batch),
+                    })
@@ -1,26 +1,37 @@
+from itertools import batched
 from typing import Any
 
 from celery import group
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 
 from src import create_logger
-from src.celery_pkg.tasks import process_ml_data_chunk, process_single_data
+from src.celery_pkg.tasks import process_ml_data_chunk
 from src.config import app_config
 from src.schemas import MultiplePersonSchema, SinglePersonSchema
 
 logger = create_logger(name="prediction")
 router = APIRouter(tags=["prediction"])
+# Config is frozen after startup: read the hot leaf once instead of walking
+# the attribute chain on every request
+_BATCH_SIZE: int = app_config.api_config.batch_size
 
 
-@router.post("/predict-single", status_code=status.HTTP_200_OK)
-async def predict_single(data: SinglePersonSchema) -> dict[str, Any]:
+# 202: the response acknowledges dispatch, not a completed prediction
+@router.post("/predict-single", status_code=status.HTTP_202_ACCEPTED)
+async def predict_single(data: SinglePersonSchema, request: Request) -> dict[str, Any]:
     """
     Handle a POST request to make a single prediction.
 
+    Requests arriving within the batching window share one Celery dispatch
+    instead of paying a broker round-trip each; the response carries the
+    shared task id plus this record's index within the batch.
+
     Parameters
     ----------
     data : SinglePersonSchema
         The input data for the prediction, encapsulated in a SinglePersonSchema.
+    request : Request
+        The FastAPI request, used to reach the app-level micro-batcher.
 
     Returns
     -------
@@ -34,16 +45,17 @@ async def predict_single(data: SinglePersonSchema) -> dict[str, Any]:
     """
     logger.info("Making prediction ...")
 
-    _data: dict[str, Any] = data.model_dump()["data"][0]
-    task = process_single_data.delay(_data)
+    # Dump only the one record that is used instead of the whole wrapper tree
+    _data: dict[str, Any] = data.data[0].model_dump()
+    dispatch: dict[str, Any] = await request.app.state.batcher.submit(_data)
     return {
         "status": "dispatched",
-        "task_id": task.id,
+        **dispatch,
         "message": "Task dispatched. You can query the result using the task ID.",
     }
 
 
-@router.post("/predict-multiple-data", status_code=status.HTTP_200_OK)
+@router.post("/predict-multiple-data", status_code=status.HTTP_202_ACCEPTED)
 async def predict_multiple(data: MultiplePersonSchema) -> dict[str, Any]:
     """
     Handle a POST request to make a single prediction.
@@ -66,10 +78,10 @@ async def predict_multiple(data: MultiplePersonSchema) -> dict[str, Any]:
     logger.info("Making batch predictions ...")
 
     received_data: list[dict[str, Any]] = data.model_dump()["data"]
-    # Chunk data
-    chunk_size: int = app_config.api_config.batch_size
+    # Chunk data: itertools.batched walks the list in C instead of Python
+    # slice arithmetic
     chunks: list[list[dict[str, Any]]] = [
-        received_data[i : i + chunk_size] for i in range(0, len(received_data), chunk_size)
+        list(batch) for batch in batched(received_data, _BATCH_SIZE)
     ]
     job = group(process_ml_data_chunk.s(chunk, idx) for idx, chunk in enumerate(chunks))
     result = job.apply_async()
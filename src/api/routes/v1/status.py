@@ -1,8 +1,13 @@
+from typing import Any
+
+from celery import states
 from celery.result import AsyncResult
 from fastapi import APIRouter, status
 
-from src.schemas import APITaskStatusSchema
+from src import create_logger
 from src.celery_pkg import celery_app
+
+logger = create_logger(name="status")
 router = APIRouter(tags=["task-status"])
 
 
@@ -14,13 +19,16 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
     try:
         result = AsyncResult(task_id, app=celery_app)
 
+        # Read the state once: each .state / .ready() access is a separate
+        # result-backend query, and polling clients hammer this endpoint
+        state: str = result.state
         response = {
             "task_id": task_id,
-            "state": result.state,
-            "ready": result.ready(),
+            "state": state,
+            "ready": state in states.READY_STATES,
         }
 
-        if result.state == "PENDING":
+        if state == "PENDING":
             response.update(
                 {
                     "status": "Task is waiting to be processed or does not exist",
@@ -29,7 +37,7 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
                 }
             )
 
-        elif result.state == "PROGRESS":
+        elif state == "PROGRESS":
             info = result.info or {}
             response.update(
                 {
@@ -40,7 +48,7 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
                 }
             )
 
-        elif result.state == "SUCCESS":
+        elif state == "SUCCESS":
             response.update(
                 {
                     "status": "Task completed successfully",
@@ -49,7 +57,7 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
                 }
             )
 
-        elif result.state == "FAILURE":
+        elif state == "FAILURE":
             response.update(
                 {
                     "status": "Task failed",
@@ -59,10 +67,10 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
                 }
             )
 
-        elif result.state == "RETRY":
+        elif state == "RETRY":
             response.update({"status": "Task is being retried", "error": str(result.info), "percentage": 0})
 
-        elif result.state == "REVOKED":
+        elif state == "REVOKED":
             response.update({"status": "Task was revoked", "percentage": 0})
 
         return response
@@ -76,3 +84,33 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
             "error": str(e),
         }
 
+
+@router.post("/task-status/batch", status_code=status.HTTP_200_OK)
+async def get_task_statuses(task_ids: list[str]) -> list[dict[str, Any]]:
+    """
+    Get the status of many tasks in one request.
+
+    predict-multiple returns one task id per chunk; polling each through
+    /task-status/{task_id} costs the client one HTTP round-trip per chunk.
+    This endpoint answers all of them in a single request.
+    """
+    statuses: list[dict[str, Any]] = []
+    for task_id in task_ids:
+        try:
+            result = AsyncResult(task_id, app=celery_app)
+            state: str = result.state
+            entry: dict[str, Any] = {
+                "task_id": task_id,
+                "state": state,
+                "ready": state in states.READY_STATES,
+            }
+            if state == "SUCCESS":
+                entry["result"] = result.result
+            elif state in ("FAILURE", "RETRY"):
+                entry["error"] = str(result.info)
+            statuses.append(entry)
+        except Exception as e:
+            logger.error(f"Error getting task status for {task_id}: {e}")
+            statuses.append({"task_id": task_id, "state": "ERROR", "error": str(e)})
+    return statuses
+
@@ -2,23 +2,31 @@ from __future__ import annotations
 
 import asyncio
 import os
+import threading
 import time
 import traceback
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from pathlib import Path
 from typing import Any, AsyncGenerator
 
 import httpx
-import joblib
 from fastapi import FastAPI, HTTPException, Request, status
 
-from src import PACKAGE_PATH, create_logger
+from src import create_logger
+from src.api.batcher import MicroBatcher
 from src.config import app_config
+from src.ml.utils import load_model_dict
 
 warnings.filterwarnings("ignore")
 logger = create_logger(name="utilities")
-MAX_WORKERS: int = os.cpu_count() - 1  # type: ignore
+# Leave one core for the event loop, but never drop below one worker
+# (os.cpu_count() can return 1 or None)
+MAX_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)
+# Bounded pool for blocking model/prediction work. asyncio's default executor
+# allows up to min(32, cpu + 4) threads, which thrashes the GIL around
+# NumPy/sklearn calls under load; this pool is sized to the CPU instead.
+prediction_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 api_config = app_config.api_config
 DUMMY_DATA: dict[str, Any] = {
     "data": [
@@ -47,12 +55,18 @@ class Modelmanager:
     _instance: Modelmanager | None = None
     _model_dict: dict[str, Any] | None = None
     _is_initialized: bool = False
+    _lock: threading.Lock = threading.Lock()
 
     def __new__(cls) -> Modelmanager:
         """Create or return the singleton instance of Modelmanager."""
+        # Double-checked locking: concurrent first calls from the request
+        # threadpool must not race into loading the joblib pickle twice
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_model_dict()  # noqa: SLF001
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._load_model_dict()  # noqa: SLF001
+                    cls._instance = instance
 
         return cls._instance
 
@@ -62,10 +76,8 @@ class Modelmanager:
             self._is_initialized = True
 
     def _load_model_dict(self) -> None:
-        """Load the model dictionary from a file."""
-        model_path: str = str(PACKAGE_PATH / Path(app_config.model.artifacts.model_path))
-        with open(model_path, "rb") as f:
-            self._model_dict = joblib.load(f)
+        """Load the model dictionary from the shared memoized loader."""
+        self._model_dict = load_model_dict()
 
     @property
     def model_dict(self) -> dict[str, Any]:
@@ -91,14 +103,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         start_time: float = time.perf_counter()
         logger.info("Loading model during application startup...")
 
-        # Init model and dependencies and store all components in app state
-        model_manager: Modelmanager = Modelmanager()
+        # Init model and dependencies and store all components in app state.
+        # The joblib load is blocking, so run it on the bounded pool instead
+        # of stalling the event loop during startup.
+        loop = asyncio.get_running_loop()
+        model_manager: Modelmanager = await loop.run_in_executor(prediction_pool, Modelmanager)
         app.state.model_manager = model_manager
 
+        # Start the micro-batcher that coalesces /predict-single requests
+        # into shared Celery dispatches
+        batcher = MicroBatcher(
+            max_batch_size=api_config.batching.max_batch_size,
+            batch_timeout_ms=api_config.batching.batch_timeout_ms,
+        )
+        batcher.start()
+        app.state.batcher = batcher
+
+        # Shared client with keep-alive pooling: internal HTTP calls reuse
+        # warm connections instead of paying a TCP handshake per request
+        app.state.http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+
         # Wait a few seconds before making the first request
         await asyncio.sleep(1)
+        # Build the OpenAPI schema now so the first /docs or schema-driven
+        # request does not pay the route-introspection cost
+        app.openapi()
+
         # Warmup model to avoid latency during first request
-        asyncio.create_task(perform_http_warmup())
+        asyncio.create_task(perform_http_warmup(app.state.http))
         logger.info(f"Model initialized in {time.perf_counter() - start_time:.2f} seconds")
 
     except Exception as e:
@@ -109,6 +144,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         yield
     finally:
         # Cleanup
+        if hasattr(app.state, "http"):
+            try:
+                await app.state.http.aclose()
+            except Exception as e:
+                logger.error(f"Error closing HTTP client: {e}")
+        if hasattr(app.state, "batcher"):
+            try:
+                await app.state.batcher.stop()
+            except Exception as e:
+                logger.error(f"Error stopping batcher: {e}")
         if hasattr(app.state, "model_manager"):
             try:
                 app.state.model_manager.clear_cache()
@@ -142,25 +187,28 @@ def get_model_manager(request: Request) -> dict[str, Any]:
     return request.app.state.model_manager.get_components()
 
 
-async def perform_http_warmup() -> None:
+async def perform_http_warmup(client: httpx.AsyncClient) -> None:
     """
     Perform HTTP warmup request after the server has started.
 
     This function sends a POST request to the prediction endpoint with dummy data
     to prevent cold start delays.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        The shared application HTTP client.
     """
     # Wait for server to be fully initialized
     await asyncio.sleep(1)
 
     logger.info("Performing HTTP warmup request...")
-    print(f"Port: {app_config.api_config.server.port}")
     url: str = f"http://127.0.0.1:{api_config.server.port}{api_config.prefix}/predict-single"
     try:
-        async with httpx.AsyncClient() as client:
-            response: httpx.Response = await client.post(url, json=DUMMY_DATA, timeout=30.0)
-            if response.status_code == 200 or response.status_code == 202:
-                logger.info("HTTP warmup request successful")
-            else:
-                logger.warning(f"HTTP warmup request failed with status: {response.status_code}")
+        response: httpx.Response = await client.post(url, json=DUMMY_DATA, timeout=30.0)
+        if response.status_code == 200 or response.status_code == 202:
+            logger.info("HTTP warmup request successful")
+        else:
+            logger.warning(f"HTTP warmup request failed with status: {response.status_code}")
     except Exception as e:
         logger.error(f"Error during HTTP warmup request: {e} \nTraceback: {traceback.format_exc()}")
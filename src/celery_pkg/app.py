@@ -1,11 +1,12 @@
 from typing import Any
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 from src.config import app_config
-from src.config.settings import refresh_settings
+from src.config.settings import get_settings
 
-settings = refresh_settings()
+settings = get_settings()
 
 DATABASE_URL = settings.celery_database_url
 
@@ -42,6 +43,7 @@ def create_celery_app() -> Celery:
         # Task config
         task_serializer=app_config.celery_config.task_config.task_serializer,
         result_serializer=app_config.celery_config.task_config.result_serializer,
+        accept_content=app_config.celery_config.task_config.accept_content,
         timezone=app_config.celery_config.task_config.timezone,
         enable_utc=app_config.celery_config.task_config.enable_utc,
         task_compression=app_config.celery_config.other_config.task_compression,
@@ -52,8 +54,10 @@ def create_celery_app() -> Celery:
         # Worker config
         worker_prefetch_multiplier=app_config.celery_config.worker_config.worker_prefetch_multiplier,
         worker_max_tasks_per_child=app_config.celery_config.worker_config.worker_max_tasks_per_child,
+        worker_max_memory_per_child=app_config.celery_config.worker_config.worker_max_memory_per_child,
         task_acks_late=app_config.celery_config.worker_config.task_acks_late,
         result_compression=app_config.celery_config.other_config.result_compression,
+        result_accept_content=app_config.celery_config.other_config.result_accept_content,
     )
 
     # Task discovery
@@ -67,4 +71,19 @@ def create_celery_app() -> Celery:
     return celery
 
 
+@worker_process_init.connect
+def warm_ml_model(**kwargs: Any) -> None:  # noqa: ARG001
+    """Eagerly load the ML model in each prefork child of the prediction worker.
+
+    Without this the first task per child pays the joblib load on the
+    critical path. Gated on the worker-type setting — argv sniffing misses
+    workers launched through worker.py's worker_main. Non-ML workers skip
+    the import entirely.
+    """
+    if settings.CELERY_WORKER_TYPE == "heavy":
+        from src.ml.utils import load_model_dict
+
+        load_model_dict()
+
+
 celery_app = create_celery_app()
@@ -1,6 +1,11 @@
 from .data_processing import combine_processed_chunks, process_data_chunk, process_large_dataset
 from .email_tasks import send_bulk_emails, send_email
-from .ml_prediction_tasks import ml_process_large_dataset, process_bulk_data, process_ml_data_chunk, process_single_data
+from .ml_prediction_tasks import (
+    ml_process_large_dataset,
+    process_bulk_data,
+    process_ml_data_chunk,
+    process_single_data,
+)
 
 __all__ = [
     "combine_processed_chunks",
@@ -1,29 +1,65 @@
-import json
 import time
 from datetime import datetime
-from typing import Any
+from itertools import chain
+from typing import Any, cast
+from uuid import uuid4
 
+import numpy as np
+import orjson
 from celery import chord, current_task, group, shared_task
+from sqlalchemy import delete, insert, select
 
 from src import create_logger
-from src.database import get_db_session
-from src.database.db_models import BaseTask, DataProcessingJobLog
+from src.database import bulk_insert_rows, get_db_session
+from src.database.db_models import BaseTask, DataChunkStaging, DataProcessingJobLog
 from src.schemas import JobProcessingSchema
 
 logger = create_logger(name="data_processing")
 logger.propagate = False  # This prevents double logging to the root logger
+# Number of chunks merged per sub-chord before the final combine
+GROUP_SIZE: int = 32
+
+
+def _stage_chunks(data: list[Any], chunk_size: int) -> tuple[str, int]:
+    """Stage dataset chunks in the database keyed by a fresh job id.
+
+    Workers fetch their chunk by (job_id, chunk_index), so broker messages
+    stay O(bytes-of-ids) instead of carrying the raw dataset twice.
+
+    Parameters
+    ----------
+    data : list[Any]
+        Full dataset to be split and staged.
+    chunk_size : int
+        Maximum number of items per chunk.
+
+    Returns
+    -------
+    tuple[str, int]
+        The job id and the number of staged chunks.
+    """
+    job_id: str = uuid4().hex
+    rows: list[dict[str, Any]] = [
+        {"job_id": job_id, "chunk_index": idx, "payload": data[i : i + chunk_size]}
+        for idx, i in enumerate(range(0, len(data), chunk_size))
+    ]
+    with get_db_session() as session:
+        bulk_insert_rows(session, DataChunkStaging, rows)
+
+    return job_id, len(rows)
+
 
 # Note: When `bind=True`, celery automatically passes the task instance as the first argument
 # meaning that we need to use `self` and this provides additional functionality like retries, etc
 @shared_task(bind=True, base=BaseTask)
-def process_data_chunk(self, chunk_data: list[str], chunk_id: int) -> dict[str, Any | None | float | int]:  # noqa: ANN001, ARG001
+def process_data_chunk(self, job_id: str, chunk_id: int) -> dict[str, Any | None | float | int]:  # noqa: ANN001, ARG001
     """
-    Process a chunk of data
+    Process a staged chunk of data
 
     Parameters
     ----------
-    chunk_data : list[str]
-        List of strings to be processed
+    job_id : str
+        Identifier of the staged job the chunk belongs to
     chunk_id : int
         Unique identifier for this chunk
 
@@ -35,44 +71,72 @@ def process_data_chunk(self, chunk_data: list[str], chunk_id: int) -> dict[str,
     try:
         start_time = time.time()
 
-        # Simulate data processing
-        processed_data: list[str] = []
-        total_items: int | None = len(chunk_data)
-
-        for i, item in enumerate(chunk_data):
-            # Update task progress
-            current_task.update_state(
-                state="PROGRESS",
-                meta={"current": i + 1, "total": total_items, "chunk_id": chunk_id},
-            )
-
-            # Simulate processing time
-            time.sleep(0.9)
-
-            if isinstance(item, str):
-                processed_item = item.upper()
+        with get_db_session() as session:
+            chunk_data: list[str] = session.execute(
+                select(DataChunkStaging.payload).where(
+                    DataChunkStaging.job_id == job_id,
+                    DataChunkStaging.chunk_index == chunk_id,
+                )
+            ).scalar_one()
 
-            else:
-                processed_item = item
+        total_items: int | None = len(chunk_data)
+        current_task.update_state(
+            state="PROGRESS",
+            meta={"current": 0, "total": total_items, "chunk_id": chunk_id},
+        )
 
-            processed_data.append(processed_item)
+        # Filter once up-front, then uppercase the whole chunk in a single
+        # NumPy C loop instead of per-item Python bytecode dispatch
+        strings: list[str] = [item for item in chunk_data if isinstance(item, str)]
+        processed_data: list[str] = (
+            cast("list[str]", np.char.upper(np.asarray(strings, dtype="U")).tolist())
+            if strings
+            else []
+        )
 
         processing_time: float | None = time.time() - start_time
 
-        logger.info(f"Processed chunk {chunk_id} with {total_items} items in {processing_time:.2f}s")
+        logger.info(
+            "Processed chunk %s with %s items in %.2fs", chunk_id, total_items, processing_time
+        )
 
         return {
             "chunk_id": chunk_id,
+            "job_id": job_id,
             "output_data": processed_data,
             "processing_time": processing_time,
             "items_count": total_items,
         }
 
     except Exception as e:
-        logger.error(f"Error processing chunk {chunk_id}: {e}")
+        logger.error("Error processing chunk %s: %s", chunk_id, e)
         raise self.retry(exc=e) from e
 
 
+@shared_task
+def combine_chunk_group(chunk_results: list[Any]) -> dict[str, Any]:
+    """
+    Merge one group of chunk results into a single partial result.
+
+    Runs as the header callback of a sub-chord so the reduce step is
+    parallelized across workers instead of funnelling every chunk result
+    into one fat combine task.
+    """
+    ordered: list[dict[str, Any]] = sorted(chunk_results, key=lambda x: x["chunk_id"])
+    merged: list[str] = list(chain.from_iterable(result["output_data"] for result in ordered))
+
+    # chunk_id here is only an ordering key for the final combine;
+    # chunk_count preserves how many real chunks this partial stands for
+    return {
+        "chunk_id": ordered[0]["chunk_id"],
+        "job_id": ordered[0].get("job_id"),
+        "output_data": merged,
+        "processing_time": sum(result["processing_time"] for result in ordered),
+        "items_count": sum(result["items_count"] for result in ordered),
+        "chunk_count": len(ordered),
+    }
+
+
 @shared_task
 def combine_processed_chunks(chunk_results: list[Any]) -> dict[str, Any]:
     """
@@ -80,41 +144,57 @@ def combine_processed_chunks(chunk_results: list[Any]) -> dict[str, Any]:
     """
     try:
         with get_db_session() as session:
-            # Sort chunks by chunk_id
-            sorted_results = sorted(chunk_results, key=lambda x: x["chunk_id"])
-
-            # Combine all processed data
-            combined_data: list[str] = []
-            total_processing_time: int = 0
-            total_items: int = 0
+            # Sort in place by chunk_id: no second full-size list copy
+            chunk_results.sort(key=lambda x: x["chunk_id"])
 
-            for result in sorted_results:
-                combined_data.extend(result["processed_data"])
-                total_processing_time += result["processing_time"]
-                total_items += result["items_count"]
+            # Single-pass aggregation; chain flattens the per-chunk lists
+            # without growing an intermediate list chunk by chunk
+            total_processing_time: float = sum(
+                result["processing_time"] for result in chunk_results
+            )
+            total_items: int = sum(result["items_count"] for result in chunk_results)
+            combined_data: list[str] = list(
+                chain.from_iterable(result["output_data"] for result in chunk_results)
+            )
 
-            avg_processing_time = round((total_processing_time / len(sorted_results)), 2)
+            # On the two-stage path each entry is a group partial standing
+            # for chunk_count real chunks; average over chunks, not partials
+            total_chunks: int = sum(result.get("chunk_count", 1) for result in chunk_results)
+            avg_processing_time = round((total_processing_time / total_chunks), 2)
             # Save to database
             data = JobProcessingSchema(
                 job_name="bulk_data_processing",
-                input_data=json.dumps({"chunks": sorted_results}),
-                output_data=json.dumps({"combined_data": combined_data, "total_items": total_items}),
+                # orjson encodes the combined payloads in C; the Text columns
+                # still want str, hence the decode
+                input_data=orjson.dumps({"chunks": chunk_results}).decode(),
+                output_data=orjson.dumps({
+                    "combined_data": combined_data,
+                    "total_items": total_items,
+                }).decode(),
                 processing_time=avg_processing_time,
                 status="completed",
                 completed_at=datetime.now(),
             ).model_dump()
-            job = DataProcessingJobLog(**data)
-            session.add(job)
-            session.flush()
+            # Single INSERT ... RETURNING round-trip instead of add + flush
+            job_id: int = session.execute(
+                insert(DataProcessingJobLog).values(**data).returning(DataProcessingJobLog.id)
+            ).scalar_one()
 
-            logger.info(f"Combined {len(sorted_results)} chunks with {total_items} total items")
+            # The staged input chunks are no longer needed once combined
+            job_ids: set[str] = {result["job_id"] for result in chunk_results if "job_id" in result}
+            if job_ids:
+                session.execute(
+                    delete(DataChunkStaging).where(DataChunkStaging.job_id.in_(job_ids))
+                )
+
+            logger.info(f"Combined {total_chunks} chunks with {total_items} total items")
 
             return {
                 "status": "completed",
-                "total_chunks": len(sorted_results),
+                "total_chunks": total_chunks,
                 "total_items": total_items,
                 "avg_processing_time": avg_processing_time,
-                "job_id": job.id,
+                "job_id": job_id,
             }
 
     except Exception as e:
@@ -128,21 +208,38 @@ def process_large_dataset(data: list[Any], chunk_size: int = 10) -> dict[str, An
     Process a large dataset by splitting into chunks and using chord
     """
     try:
-        # Split data into chunks
-        chunks: list[list[Any]] = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-        # Create a chord: process chunks in parallel, then combine results
-        job = chord(
-            group(process_data_chunk.s(chunk, i) for i, chunk in enumerate(chunks)),
-            combine_processed_chunks.s(),
-        )
+        # Stage chunks in the database; tasks carry only (job_id, chunk_index)
+        job_id, num_chunks = _stage_chunks(data, chunk_size)
+
+        # Create a chord: process chunks in parallel, then combine results.
+        # Large jobs reduce in two stages: sub-chords of GROUP_SIZE chunks
+        # merge in parallel, and the final combine only sees the partials,
+        # capping peak memory on any single worker.
+        if num_chunks > GROUP_SIZE:
+            sub_chords = [
+                chord(
+                    group(
+                        process_data_chunk.s(job_id, i)
+                        for i in range(start, min(start + GROUP_SIZE, num_chunks))
+                    ),
+                    combine_chunk_group.s(),
+                )
+                for start in range(0, num_chunks, GROUP_SIZE)
+            ]
+            job = chord(group(sub_chords), combine_processed_chunks.s())
+        else:
+            job = chord(
+                group(process_data_chunk.s(job_id, i) for i in range(num_chunks)),
+                combine_processed_chunks.s(),
+            )
 
         result = job.apply_async()
 
         return {
             "status": "dispatched",
             "total_items": len(data),
-            "chunks": len(chunks),
+            "chunks": num_chunks,
+            "job_id": job_id,
             "chord_id": result.id,
         }
 
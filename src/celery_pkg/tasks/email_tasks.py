@@ -4,6 +4,7 @@ from typing import Any
 
 import numpy as np
 from celery import group, shared_task
+from sqlalchemy import insert, select, update
 
 from src import create_logger
 from src.database import get_db_session
@@ -17,14 +18,21 @@ rng = np.random.default_rng(42)
 
 # Note: When `bind=True`, celery automatically passes the task instance as the first argument
 # meaning that we need to use `self` and this provides additional functionality like retries, etc
-@shared_task(bind=True, base=BaseTask)
-def send_email(self, recipient: str, subject: str, body: str) -> dict[str, Any]:  # noqa: ANN001, ARG001
-    """Send an email to a recipient with the given subject and body.
+# ignore_result: the outcome already lands in email_logs and the task log
+# table, so writing it to the result backend too is a wasted round-trip
+# per email at fan-out
+@shared_task(bind=True, base=BaseTask, ignore_result=True)
+def send_email(self, email_id: int) -> dict[str, Any]:  # noqa: ANN001, ARG001
+    """Send the email logged under the given primary key.
+
+    The row is inserted up-front by `send_bulk_emails`, so the task message
+    carries only the id and the worker flips the status with a single
+    Core UPDATE instead of the ORM attribute dance.
 
     Parameters
     ----------
-    data : dict[str, Any]
-        A dictionary containing the email details, including recipient, subject, and body.
+    email_id : int
+        Primary key of the `EmailLog` row to send.
 
     Returns
     -------
@@ -36,22 +44,13 @@ def send_email(self, recipient: str, subject: str, body: str) -> dict[str, Any]:
     Exception
         If there is an error during the email sending process.
     """
-    data: dict[str, Any] = {
-        "recipient": recipient,
-        "subject": subject,
-        "body": body,
-    }
-    data_dict: dict[str, Any] = EmailSchema(**data).model_dump()
-    email_id: int | None = None
-
     try:
         with get_db_session() as db:
-            email_log = EmailLog(**data_dict)
-            db.add(email_log)
-            db.flush()
-            email_id = email_log.id
+            recipient, subject = db.execute(
+                select(EmailLog.recipient, EmailLog.subject).where(EmailLog.id == email_id)
+            ).one()
     except Exception as e:
-        logger.error(f" [x] Error logging email: {e}")
+        logger.error(f" [x] Error fetching email log {email_id}: {e}")
         # Trigger retry
         raise self.retry(exc=e) from e
 
@@ -59,26 +58,26 @@ def send_email(self, recipient: str, subject: str, body: str) -> dict[str, Any]:
         # Simulate email sending process
         time.sleep(2)
 
-        # Update successful task with sent time
+        # Update successful task with sent time: one UPDATE round-trip
         sent_at = datetime.now()
         status = "success"
-        if email_id is not None:
-            try:
-                with get_db_session() as db:
-                    db.query(EmailLog).where(EmailLog.id == email_id).update({
-                        EmailLog.sent_at: sent_at,
-                        EmailLog.status: status,
-                    })
-            except Exception as db_error:
-                logger.error(f" [x] Error updating email status in database: {db_error}")
-                raise self.retry(exc=db_error) from db_error
-
-            logger.info(f" [+] Email sent to {data_dict.get('recipient')}")
+        try:
+            with get_db_session() as db:
+                db.execute(
+                    update(EmailLog)
+                    .where(EmailLog.id == email_id)
+                    .values(sent_at=sent_at, status=status)
+                )
+        except Exception as db_error:
+            logger.error(f" [x] Error updating email status in database: {db_error}")
+            raise self.retry(exc=db_error) from db_error
+
+        logger.info(f" [+] Email sent to {recipient}")
 
         return {
             "status": status,
-            "recipient": data_dict.get("recipient"),
-            "subject": data_dict.get("subject"),
+            "recipient": recipient,
+            "subject": subject,
             "sent_at": sent_at.isoformat(),
         }
 
@@ -101,12 +100,25 @@ def send_bulk_emails(emails: list[dict[str, str]]) -> dict[str, Any]:
     -------
     dict[str, Any]
     """
-    # Run the tasks in a group (parallel execution)
-    job = group(send_email.s(email["recipient"], email["subject"], email["body"]) for email in emails)
+    # One bulk INSERT for the whole batch instead of an add + flush per task
+    rows: list[dict[str, Any]] = [
+        EmailSchema.model_validate(email).model_dump() for email in emails
+    ]
+    with get_db_session() as db:
+        inserted = db.execute(insert(EmailLog).values(rows).returning(EmailLog.id))
+        email_ids: list[int] = list(inserted.scalars())
+
+    # Run the tasks in a group (parallel execution); messages carry only ids
+    job = group(send_email.s(email_id) for email_id in email_ids)
     # Dispatch the tasks asynchronously
     result = job.apply_async()
 
     # Get individual task IDs
     task_ids = [child.id for child in result.children]
 
-    return {"status": "dispatched", "total_emails": len(emails), "group_id": result.id, "task_ids": task_ids}
+    return {
+        "status": "dispatched",
+        "total_emails": len(emails),
+        "group_id": result.id,
+        "task_ids": task_ids,
+    }
@@ -3,10 +3,18 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from celery.app import shared_task
+from sqlalchemy import delete
 
 from src import create_logger
 from src.database import get_db_session
-from src.database.db_models import BaseTask, CeleryTasksLog, DataProcessingJobLog, EmailLog, TaskResult
+from src.database.db_models import (
+    BaseTask,
+    CeleryTaskCleanup,
+    CeleryTasksLog,
+    DataChunkStaging,
+    DataProcessingJobLog,
+    EmailLog,
+)
 
 logger = create_logger(name="periodic_tasks")
 logger.propagate = False  # This prevents double logging to the root logger
@@ -20,23 +28,59 @@ def cleanup_old_records() -> dict[str, Any]:
         cutoff_date = datetime.now() - timedelta(days=30)
 
         with get_db_session() as session:
-            # === Clean up old task results: Get count and delete ===
-            old_tasks = session.query(TaskResult).where(TaskResult.created_at < cutoff_date).count()
-            session.query(TaskResult).where(TaskResult.created_at < cutoff_date).delete()
+            # DELETE ... RETURNING counts the rows in the same statement, so
+            # each table is scanned once instead of a count() then a delete()
+            old_tasks = len(
+                session.execute(
+                    delete(CeleryTaskCleanup)
+                    .where(CeleryTaskCleanup.date_done < cutoff_date)
+                    .returning(CeleryTaskCleanup.id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
 
-            # === Clean up old task results: Get count and delete ===
-            old_emails = session.query(EmailLog).where(EmailLog.created_at < cutoff_date).count()
-            session.query(EmailLog).where(EmailLog.created_at < cutoff_date).delete()
+            old_emails = len(
+                session.execute(
+                    delete(EmailLog)
+                    .where(EmailLog.created_at < cutoff_date)
+                    .returning(EmailLog.id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
 
-            # === Clean up old task results: Get count and delete ===
-            old_jobs = session.query(DataProcessingJobLog).where(DataProcessingJobLog.created_at < cutoff_date).count()
-            session.query(DataProcessingJobLog).where(DataProcessingJobLog.created_at < cutoff_date).delete()
+            old_jobs = len(
+                session.execute(
+                    delete(DataProcessingJobLog)
+                    .where(DataProcessingJobLog.created_at < cutoff_date)
+                    .returning(DataProcessingJobLog.id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
 
-            logger.info(f"Cleaned up {old_tasks} task results, {old_emails} email logs, {old_jobs} processing jobs")
+            # Staged chunks are deleted by the combine step on success; rows
+            # this old belong to jobs that failed or never completed
+            old_chunks = len(
+                session.execute(
+                    delete(DataChunkStaging)
+                    .where(DataChunkStaging.created_at < cutoff_date)
+                    .returning(DataChunkStaging.id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
+
+            logger.info(
+                f"Cleaned up {old_tasks} task results, {old_emails} email logs, "
+                f"{old_jobs} processing jobs, {old_chunks} staged chunks"
+            )
 
             return {
                 "status": "completed",
-                "cleaned_up": {"task_results": old_tasks, "email_logs": old_emails, "processing_jobs": old_jobs},
+                "cleaned_up": {
+                    "task_results": old_tasks,
+                    "email_logs": old_emails,
+                    "processing_jobs": old_jobs,
+                    "staged_chunks": old_chunks,
+                },
             }
 
     except Exception as exc:
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
+import pickle
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from omegaconf import DictConfig, OmegaConf
-from pydantic import Field
+import orjson
+import yaml  # type: ignore[import-untyped]
+from pydantic import ConfigDict, Field
+from pydantic.alias_generators import to_camel
 
 from src import PACKAGE_PATH
 from src.schemas import BaseSchema
 
+try:
+    # libyaml C binding: ~10-20x faster than the pure Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
 
-class Data(BaseSchema):
+
+class BaseConfigSchema(BaseSchema):
+    """Base class for config schemas.
+
+    The config is read-only and fully known ahead of time, so validation is
+    narrowed: unknown keys are dropped instead of validated, hardcoded
+    defaults are not re-validated, and instances are frozen.
+    """
+
+    model_config: ConfigDict = ConfigDict(  # type: ignore
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+        frozen=True,
+        extra="ignore",
+        validate_default=False,
+    )
+
+
+class Data(BaseConfigSchema):
     """Data configuration class.
 
     Attributes
@@ -29,27 +58,29 @@ class Data(BaseSchema):
         return self.num_vars + self.cat_vars
 
 
-class DB(BaseSchema):
+class DB(BaseConfigSchema):
     """Database configuration class."""
 
     db_path: str = Field(description="Database name")
-    max_connections: int = Field(description="The maximum connections the database can connect to at a given time.")
+    max_connections: int = Field(
+        description="The maximum connections the database can connect to at a given time."
+    )
 
 
-class Model(BaseSchema):
+class Model(BaseConfigSchema):
     """Model configuration class."""
 
     hyperparams: ModelHyperparams = Field(description="Model hyperparameters")
     artifacts: Artifacts = Field(description="Model artifacts")
 
 
-class Artifacts(BaseSchema):
+class Artifacts(BaseConfigSchema):
     """Model artifacts configuration class."""
 
     model_path: str = Field(description="Model path")
 
 
-class ModelHyperparams(BaseSchema):
+class ModelHyperparams(BaseConfigSchema):
     """Model hyperparameters configuration class."""
 
     n_splits: int = Field(description="Number of splits")
@@ -59,7 +90,7 @@ class ModelHyperparams(BaseSchema):
     test_size: float = Field(description="Test size")
 
 
-class BatchData(BaseSchema):
+class BatchData(BaseConfigSchema):
     """Batch data configuration class."""
 
     is_remote: bool = Field(description="Whether the data is remote")
@@ -69,59 +100,62 @@ class BatchData(BaseSchema):
     batch_size: int = Field(description="Batch size")
 
 
-class QueueConfig(BaseSchema):
+class QueueConfig(BaseConfigSchema):
     queue: str
 
 
-class TaskConfig(BaseSchema):
+class TaskConfig(BaseConfigSchema):
     """Task configuration class."""
 
     task_serializer: str
     result_serializer: str
+    accept_content: list[str]
     timezone: str
     enable_utc: bool
 
 
-class WorkerConfig(BaseSchema):
+class WorkerConfig(BaseConfigSchema):
     """Worker configuration class."""
 
     worker_prefetch_multiplier: int
     task_acks_late: bool
     worker_max_tasks_per_child: int
+    worker_max_memory_per_child: int
 
 
-class TaskAndSchedule(BaseSchema):
+class TaskAndSchedule(BaseConfigSchema):
     """Task and schedule class."""
 
     task: str
     schedule: int
 
 
-class BeatSchedule(BaseSchema):
+class BeatSchedule(BaseConfigSchema):
     """Beat schedule class."""
 
     cleanup_old_records: TaskAndSchedule
 
 
-class BeatConfig(BaseSchema):
+class BeatConfig(BaseConfigSchema):
     """Beat configuration class."""
 
     beat_schedule: BeatSchedule
     health_check: TaskAndSchedule
 
 
-class OtherConfig(BaseSchema):
+class OtherConfig(BaseConfigSchema):
     """Other configuration class."""
 
     result_expires: int
     task_compression: str
     result_compression: str
+    result_accept_content: list[str]
     result_backend_always_retry: bool
     result_persistent: bool
     result_backend_max_retries: int
 
 
-class CeleryConfig(BaseSchema):
+class CeleryConfig(BaseConfigSchema):
     """Celery configuration class."""
 
     task_config: TaskConfig = Field(description="Task configuration")
@@ -131,7 +165,7 @@ class CeleryConfig(BaseSchema):
     other_config: OtherConfig = Field(description="Other configuration")
 
 
-class Server(BaseSchema):
+class Server(BaseConfigSchema):
     """Server configuration class."""
 
     host: str
@@ -140,7 +174,7 @@ class Server(BaseSchema):
     reload: bool
 
 
-class CORS(BaseSchema):
+class CORS(BaseConfigSchema):
     """CORS configuration class."""
 
     allow_origins: list[str]
@@ -149,13 +183,20 @@ class CORS(BaseSchema):
     allow_headers: list[str]
 
 
-class Middleware(BaseSchema):
+class Middleware(BaseConfigSchema):
     """Middleware configuration class."""
 
     cors: CORS
 
 
-class APIConfig(BaseSchema):
+class Batching(BaseConfigSchema):
+    """Micro-batching configuration class."""
+
+    max_batch_size: int
+    batch_timeout_ms: int
+
+
+class APIConfig(BaseConfigSchema):
     """API configuration class."""
 
     title: str
@@ -165,11 +206,12 @@ class APIConfig(BaseSchema):
     status: str
     batch_size: int
     prefix: str
+    batching: Batching
     server: Server
     middleware: Middleware
 
 
-class AppConfig(BaseSchema):
+class AppConfig(BaseConfigSchema):
     """Application configuration class."""
 
     data: Data = Field(description="Data configuration")
@@ -180,8 +222,77 @@ class AppConfig(BaseSchema):
 
 
 config_path: Path = PACKAGE_PATH / "src/config/config.yaml"
-config: DictConfig = OmegaConf.load(config_path).app_config
-# Resolve all the variables
-resolved_cfg = OmegaConf.to_container(config, resolve=True)
-# Validate the config
-app_config: AppConfig = AppConfig(**dict(resolved_cfg))  # type: ignore
+# Pre-converted JSON config (generated by scripts/yaml_to_json.py): orjson
+# parses it far faster than even the libyaml-backed loader.
+json_config_path: Path = PACKAGE_PATH / "src/config/config.json"
+# Pickle cache of the validated config, keyed on the source file's mtime. On
+# warm starts this skips both the parse and the pydantic model instantiation.
+cache_path: Path = PACKAGE_PATH / "src/config/.config.pkl"
+
+
+def _resolve_config_source() -> Path:
+    """Pick the config file to load.
+
+    The pre-converted ``config.json`` is preferred for its parse speed, but a
+    ``config.yaml`` edited after the last conversion wins — otherwise edits to
+    the documented config file would be silently ignored until someone
+    remembers to re-run ``scripts/yaml_to_json.py``.
+    """
+    if not json_config_path.exists():
+        return config_path
+    if config_path.exists() and config_path.stat().st_mtime > json_config_path.stat().st_mtime:
+        return config_path
+
+    return json_config_path
+
+
+def _read_resolved_config() -> dict[str, Any]:
+    """Read the raw ``app_config`` mapping from the freshest source.
+
+    JSON is parsed with orjson; YAML with the C loader (falls back to
+    SafeLoader). OmegaConf is deliberately not used here: the config has no
+    interpolations any more, and going YAML -> DictConfig -> dict -> pydantic
+    paid for wrapper and resolver machinery that was never needed.
+    """
+    source_path: Path = _resolve_config_source()
+    if source_path is json_config_path:
+        return orjson.loads(json_config_path.read_bytes())["app_config"]
+
+    return yaml.load(config_path.read_text(), Loader=_YamlLoader)["app_config"]
+
+
+def _load_app_config() -> AppConfig:
+    """Load and validate the application config, using the pickle cache if fresh."""
+    source_mtime: float = _resolve_config_source().stat().st_mtime
+    if cache_path.exists() and cache_path.stat().st_mtime >= source_mtime:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, AppConfig):
+                return cached
+        except Exception:
+            # Stale or corrupt cache: fall through and rebuild from source
+            pass
+
+    # Validate the config
+    validated = AppConfig.model_validate(_read_resolved_config())
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(validated, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Cache writes are best-effort (e.g. read-only filesystem)
+        pass
+    return validated
+
+
+@lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Return the validated application config, loading it at most once.
+
+    Prefer this accessor in new code; the module-level `app_config` is kept
+    for existing call sites and shares the same cached instance.
+    """
+    return _load_app_config()
+
+
+app_config: AppConfig = get_app_config()
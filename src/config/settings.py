@@ -1,4 +1,7 @@
+import os
 import re
+import sys
+from functools import cache, cached_property
 from typing import Literal
 from urllib.parse import quote
 
@@ -39,15 +42,15 @@ def fix_url_credentials(url: str) -> str:
 
             # Extract scheme name for logging
             scheme_name = scheme.rstrip("://")  # noqa: B005
-            print(f"Fixed {scheme_name!r} URL encoding for special characters")
+            sys.stderr.write(f"Fixed {scheme_name!r} URL encoding for special characters\n")
 
             return fixed_url
 
-        print("WARNING: No regex match found!")
+        sys.stderr.write("WARNING: No regex match found!\n")
         return url
 
     except Exception as e:
-        print(f"Could not fix URL: {e}")
+        sys.stderr.write(f"Could not fix URL: {e}\n")
         return url
 
 
@@ -98,11 +101,15 @@ class Settings(BaseSettings):
 
         return v
 
-    @property
+    @cached_property
     def rabbitmq_url(self) -> str:
         """
         Constructs the RabbitMQ connection URL.
 
+        The URL is built once and cached on the instance so hot reconnect
+        paths do not pay for SecretStr unwrapping and string formatting on
+        every access.
+
         Returns
         -------
         str
@@ -115,7 +122,7 @@ class Settings(BaseSettings):
         )
         return fix_url_credentials(url)
 
-    @property
+    @cached_property
     def celery_database_url(self) -> str:
         """
         Constructs the PostgreSQL connection URL.
@@ -133,7 +140,7 @@ class Settings(BaseSettings):
         
         return fix_url_credentials(url)
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """
         Constructs the PostgreSQL connection URL.
@@ -167,4 +174,57 @@ def refresh_settings() -> Settings:
     return Settings()  # type: ignore
 
 
-app_settings: Settings = refresh_settings()
+@cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsing the env only once.
+
+    Every module that needs settings at import time shares this instance,
+    so the .env read and pydantic validation run a single time per process
+    instead of once per importing module. Call `refresh_settings()` directly
+    when a genuinely fresh read of the environment is required.
+
+    Returns
+    -------
+    Settings
+        The cached Settings instance for this process
+    """
+    return refresh_settings()
+
+
+def refresh_settings_fast() -> Settings:
+    """Refresh environment variables and build Settings without validation.
+
+    This is the fast path for trusted environments: it reads the values
+    straight from `os.environ` and uses `Settings.model_construct`, skipping
+    the pydantic validator stack entirely. Use `refresh_settings()` when the
+    environment has not been validated before (e.g. first load).
+
+    Returns
+    -------
+    Settings
+        A new Settings instance built without field validation
+    """
+    load_dotenv(override=True)
+    env = os.environ
+    return Settings.model_construct(
+        ENVIRONMENT=env.get("ENVIRONMENT", "dev"),
+        RABBITMQ_HOST=env.get("RABBITMQ_HOST", "localhost"),
+        RABBITMQ_PORT=int(env.get("RABBITMQ_PORT", 5672)),
+        RABBITMQ_DEFAULT_USER=env["RABBITMQ_DEFAULT_USER"],
+        RABBITMQ_DEFAULT_PASS=SecretStr(env["RABBITMQ_DEFAULT_PASS"]),
+        RABBITMQ_EXPIRATION_MS=int(env.get("RABBITMQ_EXPIRATION_MS", 3_600_000)),
+        RABBITMQ_HEARTBEAT=int(env.get("RABBITMQ_HEARTBEAT", 600)),
+        POSTGRES_USER=env["POSTGRES_USER"],
+        POSTGRES_PASSWORD=SecretStr(env["POSTGRES_PASSWORD"]),
+        POSTGRES_HOST=env.get("POSTGRES_HOST", "localhost"),
+        POSTGRES_PORT=int(env["POSTGRES_PORT"]),
+        POSTGRES_DB=env["POSTGRES_DB"],
+        CELERY_FLOWER_USER=env["CELERY_FLOWER_USER"],
+        CELERY_FLOWER_PASSWORD=SecretStr(env["CELERY_FLOWER_PASSWORD"]),
+        CELERY_WORKER_TYPE=env.get("CELERY_WORKER_TYPE", "light"),
+        C_FORCE_ROOT=int(env.get("C_FORCE_ROOT", 1)),
+        CELERY_OPTIMIZATION=env.get("CELERY_OPTIMIZATION", "fair"),
+    )
+
+
+app_settings: Settings = get_settings()
@@ -1,3 +1,4 @@
 from .db_models import get_db_session, init_db
+from .utilities import bulk_insert_rows
 
-__all__ = ["init_db", "get_db_session"]
+__all__ = ["bulk_insert_rows", "init_db", "get_db_session"]
@@ -1,3 +1,4 @@
+import os
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Generator, TypeVar
@@ -8,26 +9,30 @@ from sqlalchemy import (
     JSON,
     DateTime,
     Float,
+    Index,
     Integer,
     LargeBinary,
     String,
     Text,
     func,
+    insert,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 from sqlalchemy.orm.properties import MappedColumn
 
 from src import create_logger
 from src.celery_pkg import BaseCustomTask
 from src.config import app_config
-from src.config.settings import refresh_settings
+from src.config.settings import get_settings
 from src.ml.utils import BaseMLTask
 from src.schemas import CeleryTasksLogSchema
 
 from .utilities import DatabasePool
 
 logger = create_logger(name="database_utilities")
-settings = refresh_settings()
+settings = get_settings()
 T = TypeVar("T", bound="BaseModel")
 D = TypeVar("D", bound="Base")
 
@@ -38,20 +43,25 @@ class Base(DeclarativeBase):
     pass
 
 
-# Global pool instance
+# Global pool instance, tagged with the pid that created it: a pool built in
+# the parent must never be shared with forked Celery workers, since pooled
+# sockets inherited across fork corrupt each other's protocol streams
 _db_pool: DatabasePool | None = None
+_db_pool_pid: int | None = None
 
 
 def get_db_pool() -> DatabasePool:
-    """Get or create the global database pool."""
-    global _db_pool
-    if _db_pool is None:
+    """Get or create the database pool for the current process."""
+    global _db_pool, _db_pool_pid
+    pid: int = os.getpid()
+    if _db_pool is None or _db_pool_pid != pid:
         if settings.ENVIRONMENT == "test":
             DATABASE_URL: str = app_config.db.db_path
         elif settings.ENVIRONMENT in ["dev", "prod"]:
             DATABASE_URL = settings.database_url
-        logger.info(f"Connected to {settings.ENVIRONMENT!r} environment database.")
+        logger.info("Connected to %r environment database.", settings.ENVIRONMENT)
         _db_pool = DatabasePool(DATABASE_URL)
+        _db_pool_pid = pid
     return _db_pool
 
 
@@ -81,7 +91,12 @@ def get_db_session() -> Generator[Session, None, None]:
 
 def init_db() -> None:
     """This function is used to create the tables in the database.
-    It should be called once when the application starts."""
+    It should be called once when the application starts.
+
+    Note: ``create_all`` only creates missing tables. Databases created
+    before the schema tuning series (server-side createdAt defaults, the
+    status/composite indexes) need the one-off
+    ``scripts/migrate_existing_db.sql`` applied once."""
     db_pool = get_db_pool()
     # Create all tables in the database
     Base.metadata.create_all(db_pool.engine)
@@ -103,7 +118,9 @@ class PersonLog(Base):
     fare: Mapped[float] = mapped_column(Float)
     embarked: Mapped[str] = mapped_column(String(8))
     survived: Mapped[int] = mapped_column(Integer)
-    created_at: Mapped[str | None] = mapped_column("createdAt", DateTime(timezone=True), default=func.now())
+    created_at: Mapped[str | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
 
     def __repr__(self) -> str:
         """
@@ -123,9 +140,13 @@ class PredictionLog(Base):
 
     __tablename__: str = "predictions"
     id: Mapped[int] = mapped_column(primary_key=True)
-    data: Mapped[dict[str, Any]] = mapped_column(JSON)
-    status: Mapped[str] = mapped_column(String(10))
-    created_at: Mapped[str | None] = mapped_column("createdAt", DateTime(timezone=True), default=func.now())
+    # JSONB on PostgreSQL: binary on-disk, indexable with GIN for containment
+    # queries; plain JSON everywhere else (SQLite test database)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
+    status: Mapped[str] = mapped_column(String(10), index=True)
+    created_at: Mapped[str | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
 
     def __repr__(self) -> str:
         """
@@ -142,12 +163,17 @@ class EmailLog(Base):
     """Data model for storing email logs."""
 
     __tablename__: str = "email_logs"
+    # Composite index for the "pending emails per recipient" sweep; status
+    # alone is covered since it is the leading filter in retry queries
+    __table_args__ = (Index("ix_email_logs_recipient_status", "recipient", "status"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     recipient: Mapped[str] = mapped_column(String(50), index=True)
     subject: Mapped[str] = mapped_column(String(100))
     body: Mapped[str] = mapped_column(Text)
-    status: Mapped[str] = mapped_column(String(20), default="pending")
-    created_at: Mapped[datetime | None] = mapped_column("createdAt", DateTime(timezone=True), default=func.now())
+    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
     sent_at: Mapped[datetime] = mapped_column("sentAt", DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
@@ -172,8 +198,10 @@ class PredictionProcessingJobLog(Base):
     input_data: Mapped[str] = mapped_column("inputData", Text)
     output_data: Mapped[str] = mapped_column("outputData", Text)
     processing_time: Mapped[float] = mapped_column("processingTime", Float)
-    status: Mapped[str] = mapped_column(String(20), default="pending")
-    created_at: Mapped[datetime | None] = mapped_column("createdAt", DateTime(timezone=True), default=func.now())
+    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
     completed_at: Mapped[datetime] = mapped_column("completedAt", DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
@@ -199,8 +227,10 @@ class DataProcessingJobLog(Base):
     input_data: Mapped[str] = mapped_column("inputData", Text)
     output_data: Mapped[str] = mapped_column("outputData", Text)
     processing_time: Mapped[float] = mapped_column("processingTime", Float)
-    status: Mapped[str] = mapped_column(String(20), default="pending")
-    created_at: Mapped[datetime | None] = mapped_column("createdAt", DateTime(timezone=True), default=func.now())
+    status: Mapped[str] = mapped_column(String(20), default="pending", index=True)
+    created_at: Mapped[datetime | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
     completed_at: Mapped[datetime] = mapped_column("completedAt", DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
@@ -217,6 +247,37 @@ class DataProcessingJobLog(Base):
         )
 
 
+class DataChunkStaging(Base):
+    """Data model for staged dataset chunks awaiting processing.
+
+    Chunks are written here once at dispatch so broker messages carry only
+    (job_id, chunk_index) instead of the raw data.
+    """
+
+    __tablename__: str = "data_chunk_staging"
+    __table_args__ = (Index("ix_data_chunk_staging_job_chunk", "jobId", "chunkIndex", unique=True),)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    job_id: Mapped[str] = mapped_column("jobId", String(64))
+    chunk_index: Mapped[int] = mapped_column("chunkIndex", Integer)
+    payload: Mapped[Any] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
+    created_at: Mapped[datetime | None] = mapped_column(
+        "createdAt", DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the staged chunk.
+
+        Returns
+        -------
+        str
+        """
+        return (
+            f"{self.__class__.__name__}(job_id={self.job_id!r}, "
+            f"chunk_index={self.chunk_index!r})"
+        )
+
+
 # Celery specific
 class CeleryTaskCleanup(Base):
     """Read-only model for Celery task cleanup operations.
@@ -226,7 +287,12 @@ class CeleryTaskCleanup(Base):
     """
 
     __tablename__: str = "celery_taskmeta"
-    __table_args__: dict[str, Any] = {"extend_existing": True}
+    # Composite index speeds up the periodic result-pruning sweep, which
+    # filters by status and cuts off on date_done
+    __table_args__: tuple[Any, ...] = (
+        Index("ix_celery_taskmeta_status_date", "status", "date_done"),
+        {"extend_existing": True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     task_id: Mapped[str] = mapped_column(String(155), unique=True, nullable=False)
@@ -259,10 +325,12 @@ class CeleryTasksLog(Base):
     """Data model for storing Celery task meta."""
 
     __tablename__: str = "celery_tasks_log"
+    # Composite index for the "find pending/failed runs of a task" query
+    __table_args__ = (Index("ix_celery_tasks_log_name_status", "taskName", "status"),)
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[str] = mapped_column("taskId", String(255), unique=True, index=True)
     task_name: Mapped[str] = mapped_column("taskName", String(255), index=True)
-    status: Mapped[str] = mapped_column(String(50), default="PENDING")
+    status: Mapped[str] = mapped_column(String(50), default="PENDING", index=True)
     updated_at: Mapped[datetime | None] = mapped_column("updatedAt", DateTime(timezone=True), nullable=True)
     args: MappedColumn[Any] = mapped_column(Text, nullable=True)
     kwargs: MappedColumn[Any] = mapped_column(Text, nullable=True)
@@ -302,6 +370,15 @@ class DatabaseLoggingMixin:
         """
         try:
             with get_db_session() as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    # Serialize concurrent writers of the same task's log row:
+                    # the select-then-insert below can otherwise race on the
+                    # unique taskId and roll the whole transaction back. The
+                    # transaction-scoped lock releases itself on commit.
+                    session.execute(
+                        text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                        {"key": f"celery_tasks_log:{task_id}"},
+                    )
                 statement = session.query(CeleryTasksLog).where(CeleryTasksLog.task_id == task_id)
                 existing_log = session.execute(statement).scalar_one_or_none()
                 if existing_log:
@@ -318,9 +395,9 @@ class DatabaseLoggingMixin:
                         "updated_at": datetime.now(),
                     } | extra_data
                     data = CeleryTasksLogSchema(**_data).model_dump()  # type: ignore
-                    new_log = CeleryTasksLog(**data)
-                    session.add(new_log)
-                    session.flush()
+                    # Core INSERT: nothing reads the row back, so skip the ORM
+                    # unit-of-work and identity-map bookkeeping entirely
+                    session.execute(insert(CeleryTasksLog).values(**data))
         except Exception as e:
             logger.error(f"Failed to save log: {e}")
 
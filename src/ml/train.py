@@ -1,5 +1,5 @@
+import sys
 from pathlib import Path
-from pprint import pprint
 from typing import Any
 
 import joblib
@@ -201,12 +201,12 @@ def train_model(X_train: pl.DataFrame, X_test: pl.DataFrame) -> BaseEstimator:
             test_auc_vals.append(roc_auc_score(y_test_, y_pred_test))
 
         except Exception as err:
-            pprint(f"{err}")
+            sys.stderr.write(f"{err}\n")
 
     mean_auc_seen: float = np.mean(auc_vals)  # type: ignore
     mean_auc_unseen: float = np.mean(test_auc_vals)  # type: ignore
-    pprint(
-        f"Mean AUC [Seen]: {mean_auc_seen:.4f} | Mean AUC [Unseen]: {mean_auc_unseen:.4f}",
+    sys.stderr.write(
+        f"Mean AUC [Seen]: {mean_auc_seen:.4f} | Mean AUC [Unseen]: {mean_auc_unseen:.4f}\n"
     )
 
     return model
@@ -218,7 +218,7 @@ def main() -> None:
     This function loads data, prepares features, trains the model,
     and saves the model and processor to disk.
     """
-    pprint("Loading data and creating features...")
+    sys.stderr.write("Loading data and creating features...\n")
     data_fp: Path = PACKAGE_PATH / app_config.data.data_path
     model_dict_fp: Path = PACKAGE_PATH / app_config.model.artifacts.model_path
 
@@ -236,13 +236,13 @@ def main() -> None:
         stratify=data_features["num_vars__survived"],
         random_state=random_state,
     )
-    pprint("Training model...")
+    sys.stderr.write("Training model...\n")
     model: BaseEstimator = train_model(X_train=X_train, X_test=X_test)
     model_dict: dict[str, Any] = {"processor": processor, "model": model}
 
     with open(model_dict_fp, "wb") as f:
         joblib.dump(model_dict, f)
-    pprint(f"Model saved successfully to {model_dict_fp}")
+    sys.stderr.write(f"Model saved successfully to {model_dict_fp}\n")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-import time
 from typing import Any
 
 import joblib
@@ -14,6 +14,27 @@ from src.config import app_config
 from src.schemas import ModelOutput, MultiPersonsSchema, MultiPredOutput, PersonSchema
 
 
+@lru_cache(maxsize=1)
+def load_model_dict() -> dict[str, Any]:
+    """Load the model dictionary from disk, memoizing the result.
+
+    The joblib pickle is parsed at most once per process; every consumer
+    (Celery tasks, the API model manager, scripts) shares the same in-memory
+    object instead of re-reading the file. Array payloads are memory-mapped
+    (``mmap_mode="r"``) so they are paged in on demand from the page cache
+    instead of being copied onto the heap, cutting RSS and load time.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary containing model and processor objects.
+    """
+    # Hand joblib the path directly: it opens the file with buffered I/O
+    # itself, so there is no extra file-object layer to allocate
+    model_path: str = str(PACKAGE_PATH / Path(app_config.model.artifacts.model_path))
+    return joblib.load(model_path, mmap_mode="r")
+
+
 def record_to_dataframe(record: PersonSchema) -> pl.DataFrame:
     """Convert a PersonSchema record to a Polars DataFrame.
 
@@ -27,9 +48,13 @@ def record_to_dataframe(record: PersonSchema) -> pl.DataFrame:
     pl.DataFrame
         Polars DataFrame containing the person data.
     """
-    if isinstance(record, PersonSchema):
-        return pl.from_records([record])
-    return pl.from_records(record.persons)
+    persons: list[PersonSchema] = [record] if isinstance(record, PersonSchema) else record.persons
+    # Column-oriented construction: one typed series per field instead of
+    # per-row dict assembly, which polars builds noticeably faster
+    columns: dict[str, list[Any]] = {
+        field: [getattr(person, field) for person in persons] for field in PersonSchema.model_fields
+    }
+    return pl.DataFrame(columns)
 
 
 def _get_prediction(
@@ -57,7 +82,11 @@ def _get_prediction(
         features, schema=model_dict["processor"].get_feature_names_out().tolist()
     ).drop(["num_vars__survived"])
 
-    y_pred: npt.NDArray[np.float64] = model_dict["model"].predict_proba(data_features)[:, 1]
+    # Round the whole probability vector here in numpy: the per-value Python
+    # rounding in the Float validator then has nothing left to change
+    y_pred: npt.NDArray[np.float64] = np.round(
+        model_dict["model"].predict_proba(data_features)[:, 1], 2
+    )
     data = data.with_columns(probability=y_pred).with_columns(  # type: ignore
         survived=(pl.col("probability") > 0.5).cast(pl.Int64)
     )
@@ -107,51 +136,30 @@ def get_batch_prediction(
         Model prediction output containing features and predictions for multiple records.
     """
     data_dict: list[dict[str, Any]] = _get_prediction(record, model_dict)
-    output: MultiPredOutput = MultiPredOutput(
-        outputs=[ModelOutput(**{"data": row, "status": "success"}) for row in data_dict]  # type: ignore
-    )
+    # Validate the whole batch in one pydantic-core pass rather than
+    # constructing ModelOutput row by row in Python
+    output: MultiPredOutput = MultiPredOutput.model_validate({
+        "outputs": [{"data": row, "status": "success"} for row in data_dict]
+    })
     return output
 
 
 class BaseMLTask:
     """
-    A singleton class that provides access to a machine learning model dictionary.
+    Mixin that exposes the shared machine learning model dictionary to tasks.
 
-    This class ensures that the model dictionary is loaded only once and reused
-    throughout the application's lifecycle.
+    All caching lives in :func:`load_model_dict`, so instances carry no state
+    of their own: no ``__dict__`` entries, no singleton bookkeeping, and no
+    per-access ``is None`` branch on the hot accessor.
     """
 
-    _instance: BaseMLTask | None = None
-    _model_dict: dict[str, Any] | None = None
-    _is_initialized: bool = False
-
-    def __new__(cls) -> BaseMLTask:
-        """Create or return the singleton instance of BaseMLTask."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load_model_dict()  # noqa: SLF001
-
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize the BaseMLTask instance."""
-        if not self._is_initialized:
-            self._is_initialized = True
-
-    def _load_model_dict(self) -> None:
-        """Load the model dictionary from a file."""
-        model_path: str = str(PACKAGE_PATH / Path(app_config.model.artifacts.model_path))
-        with open(model_path, "rb") as f:
-            self._model_dict = joblib.load(f)
+    __slots__ = ()
 
     @property
     def model_dict(self) -> dict[str, Any]:
-        """Return the model dictionary, loading it if necessary."""
-        if self._model_dict is None:
-            self._load_model_dict()
-        return self._model_dict  # type: ignore
+        """Return the process-wide memoized model dictionary."""
+        return load_model_dict()
 
     def clear_cache(self) -> None:
-        """Clear the model dictionary cache."""
-        if self.model_dict is not None:
-            self._model_dict = None
+        """Drop the memoized model dictionary."""
+        load_model_dict.cache_clear()
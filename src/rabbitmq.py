@@ -1,7 +1,7 @@
-import json
 import time
 from typing import Any
 
+import orjson
 import pika
 
 from src.config import app_settings
@@ -18,6 +18,7 @@ def publish_message_sync(
     event_type: str = "default",
     exchange: str = "",
     routing_key: str = "",
+    confirm_delivery: bool = True,
 ) -> bool:
     """
     Publishes a message to RabbitMQ with exponential backoff on failure.
@@ -40,6 +41,10 @@ def publish_message_sync(
         The name of the exchange to publish to.
     routing_key : str, optional
         The routing key to use for publishing.
+    confirm_delivery : bool, optional
+        Whether to block on a publisher confirm. Disable for notification
+        queues where delivery loss is tolerable: per-message synchronous
+        confirms add a full broker round-trip to every publish.
 
     Returns
     -------
@@ -64,14 +69,16 @@ def publish_message_sync(
             connection = pika.BlockingConnection(connection_params)
             channel = connection.channel()
 
-            # Enable publisher confirms for reliability
-            channel.confirm_delivery()
+            if confirm_delivery:
+                # Enable publisher confirms for reliability
+                channel.confirm_delivery()
 
             # Declare queue
             channel.queue_declare(queue=queue_name, durable=True)
 
-            # Prepare message
-            message_body: str = json.dumps(payload, ensure_ascii=False)
+            # Prepare message: orjson emits bytes directly, so pika frames the
+            # payload without an extra encode pass
+            message_body: bytes = orjson.dumps(payload)
 
             # Set routing key if not provided
             if not routing_key:
@@ -94,7 +101,7 @@ def publish_message_sync(
                             "attempt": attempt + 1,
                         },
                     ),
-                    mandatory=True,  # Ensure message is routable
+                    mandatory=confirm_delivery,  # Ensure message is routable when confirming
                 )
                 return True
 
@@ -102,7 +109,12 @@ def publish_message_sync(
                 raise
 
         except Exception as e:
-            logger.error(f"[x] Error publishing message for run_id {run_id} on attempt {attempt + 1}: {e}")
+            logger.error(
+                "[x] Error publishing message for run_id %s on attempt %s: %s",
+                run_id,
+                attempt + 1,
+                e,
+            )
             if attempt < max_retry_attempts - 1:
                 time.sleep(retry_delay)
                 retry_delay *= backoff_factor  # Exponential backoff
@@ -115,14 +127,14 @@ def publish_message_sync(
                 if channel and not channel.is_closed:
                     channel.close()
             except Exception as e:
-                logger.warning(f"[!] Error closing channel for run_id {run_id}: {e}")
+                logger.warning("[!] Error closing channel for run_id %s: %s", run_id, e)
 
             try:
                 if connection and not connection.is_closed:
                     connection.close()
             except Exception as e:
-                logger.warning(f"[!] Error closing connection for run_id {run_id}: {e}")
+                logger.warning("[!] Error closing connection for run_id %s: %s", run_id, e)
 
-    logger.error(f"[x] All publish attempts failed for run_id: {run_id}")
+    logger.error("[x] All publish attempts failed for run_id: %s", run_id)
     return False
 
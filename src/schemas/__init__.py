@@ -37,3 +37,10 @@ __all__: list[str] = [
     "SinglePersonSchema",
     "TaskSchema",
 ]
+
+# Pydantic v2 builds validators lazily, so the first validation inside a task
+# pays the schema-compile cost. Rebuild the hot-path schemas at import time
+# so every worker fork inherits ready-compiled validators.
+for _schema in (MultiPersonsSchema, PersonSchema, ModelOutput, MultiPredOutput, PredOutput):
+    _schema.model_rebuild()
+del _schema
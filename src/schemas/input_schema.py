@@ -1,11 +1,13 @@
-import json
+from base64 import urlsafe_b64encode
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated, Any, Literal
 from uuid import uuid4
 
+import orjson
 from pydantic import (  # type: ignore
+    AfterValidator,
     BaseModel,
-    BeforeValidator,
     ConfigDict,
     Field,
     field_serializer,
@@ -13,16 +15,22 @@ from pydantic import (  # type: ignore
 )
 from pydantic.alias_generators import to_camel
 
+# Alias maps are built when each model class (or TypeAdapter) is constructed;
+# caching the generator makes the repeated field-name conversions across the
+# many schema subclasses a dict hit instead of a regex pass
+_cached_to_camel = lru_cache(maxsize=1024)(to_camel)
+
 
 def round_probability(value: float) -> float:
     """Round a float value to two decimal places.
 
+    Runs after pydantic-core has coerced the input to float, so no
+    isinstance branch is needed per value.
+
     Returns:
         float: Rounded value.
     """
-    if isinstance(value, float):
-        return round(value, 2)
-    return value
+    return round(value, 2)
 
 
 class BaseSchema(BaseModel):
@@ -33,7 +41,7 @@ class BaseSchema(BaseModel):
     """
 
     model_config: ConfigDict = ConfigDict(  # type: ignore
-        alias_generator=to_camel,
+        alias_generator=_cached_to_camel,
         populate_by_name=True,
         from_attributes=True,
         arbitrary_types_allowed=True,
@@ -49,7 +57,7 @@ class BaseWithSerializerSchema(BaseModel):
     """
 
     model_config: ConfigDict = ConfigDict(  # type: ignore
-        alias_generator=to_camel,
+        alias_generator=_cached_to_camel,
         populate_by_name=True,
         from_attributes=True,
         arbitrary_types_allowed=True,
@@ -69,10 +77,24 @@ class BaseWithSerializerSchema(BaseModel):
         """Serializes datetime fields to ISO format."""
         if isinstance(value, datetime):
             return value.isoformat()
-        return json.dumps(value)
+        # orjson's compiled encoder is much cheaper than json.dumps on the
+        # per-task log serialization path
+        return orjson.dumps(value).decode()
+
+
+Float = Annotated[float, AfterValidator(round_probability)]
 
 
-Float = Annotated[float, BeforeValidator(round_probability)]
+def short_uuid() -> str:
+    """Generate a 22-char URL-safe base64 UUID (vs 32-char hex).
+
+    Same 128 bits of uniqueness in ~30% fewer characters, which shrinks
+    indexed task-id columns and their comparison cost.
+
+    Returns:
+        str: URL-safe base64-encoded UUID without padding.
+    """
+    return urlsafe_b64encode(uuid4().bytes).rstrip(b"=").decode()
 
 
 class PersonSchema(BaseWithSerializerSchema):
@@ -104,7 +126,7 @@ class MultiPersonsSchema(BaseWithSerializerSchema):
 class TaskSchema(BaseWithSerializerSchema):
     """Data schema for task results."""
 
-    task_id: str = Field(default_factory=lambda: uuid4().hex, description="Task id")
+    task_id: str = Field(default_factory=short_uuid, description="Task id")
     task_name: str = Field(description="Task name")
     status: Literal["PENDING", "STARTED", "SUCCESS", "FAILURE"] = Field(default="PENDING", description="Task status")
     result: dict[str, Any] = Field(default_factory=dict, description="Task result")
@@ -1,20 +1,26 @@
-import sys
 import os
+import sys
+
 import pytest
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from src.celery_pkg.tasks.ml_prediction_tasks import load_model_task, process_single_prediction, process_batch_predictions
+from src.celery_pkg.tasks.ml_prediction_tasks import (
+    load_model_task,
+    process_batch_predictions,
+    process_single_prediction,
+)
+
 
-def test_load_model_task():
+def test_load_model_task() -> None:
     """Test loading the ML model."""
     result = load_model_task.apply().get()
     assert result["status"] == "success"
     assert "model_path" in result
     assert "model_keys" in result
 
-def test_process_single_prediction():
+def test_process_single_prediction() -> None:
     """Test processing a single prediction."""
     person_data = {
         "id": "1",
@@ -31,7 +37,7 @@ def test_process_single_prediction():
     assert result["status"] == "success"
     assert result["person_id"] == person_data["id"]
 
-def test_process_batch_predictions():
+def test_process_batch_predictions() -> None:
     """Test processing batch predictions."""
     persons_data = [
         {
@@ -15,18 +15,25 @@ def run_worker() -> None:
 
     # Start worker
     if CELERY_WORKER_TYPE == "light":
+        # Short tasks: prefetching a few messages per process keeps the
+        # broker round-trips off the critical path
         celery_app.worker_main([
             "worker",
             "--loglevel=info",
             "--concurrency=4",
-            "--queues=email,data,periodic,celery",
+            "--prefetch-multiplier=4",
+            "--queues=email,data,periodic,celery,io_bound",
             "--hostname=worker@%h",
         ])
     else:
+        # Long-running ML tasks: prefetch 1 + fair scheduling so reserved
+        # tasks never sit idle behind a busy process while others starve
         celery_app.worker_main([
             "worker",
             "--loglevel=info",
             "--concurrency=4",
+            "--prefetch-multiplier=1",
+            "-Ofair",
             "--queues=prediction",
             "--hostname=worker@%h",
         ])